@@ -7,6 +7,9 @@ __license__ = "Apache License 2.0"
 __all__ = ["ACTION_HANDLERS"]
 
 
+import sys
+import types
+
 from ..nodes import Node, TextNode, EmitNode
 from ..expr import ValueExpr
 from ..errors import ParserError
@@ -15,14 +18,26 @@ from ..errors import ParserError
 class ActionHandler:
     """ Handle evens when the parser encounters tags, text, and so on. """
 
+    # Map of action name to handle_action_<name> function, built per class
+    _dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        """ Build the action dispatch table for a handler class. """
+        super().__init_subclass__(**kwargs)
+
+        prefix = "handle_action_"
+        cls._dispatch = {
+            name[len(prefix):]: getattr(cls, name)
+            for name in dir(cls)
+            if name.startswith(prefix)
+        }
+
     def __init__(self, parser, template):
         """ Initialize the handler. """
 
         self.parser = parser
         self.template = template
 
-        self.line = 1 # current tag line when when calling parser.push_handler
-
     def handle_text(self, line, text):
         """ Add a  text node. """
         node = TextNode(self.template, line, text)
@@ -46,9 +61,9 @@ class ActionHandler:
 
     def handle_action(self, line, action, start, end):
         """ Handle action tags. """
-        handler = getattr(self, "handle_action_" + action, None)
+        handler = self._dispatch.get(action)
         if handler:
-            handler(line, start, end)
+            handler(self, line, start, end)
         else:
             self.handle_unknown_action(line, action, start, end)
 
@@ -65,16 +80,17 @@ class DefaultActionHandler(ActionHandler):
     """ Handle the default action tags. """
 
     def handle_unknown_action(self, line, action, start, end):
-        if action in ACTION_HANDLERS:
-            handler = ACTION_HANDLERS[action](self.parser, self.template)
-            handler.handle_action(line, action, start, end)
-        else:
+        handler_class = ACTION_HANDLERS.get(action)
+        if handler_class is None:
             raise ParserError(
                 "Unknown action tag: " + action,
                 self.template.filename,
                 line
             )
 
+        handler = self.parser.get_handler(handler_class)
+        handler.handle_action(line, action, start, end)
+
 
 # Import submodules
 def _import_actions():
@@ -92,9 +108,9 @@ def _import_actions():
 
         for (action_name, action_handler) in module_actions.items():
             assert action_name not in actions, "Duplicate Action {0}".format(action_name)
-            actions[action_name] = action_handler
+            actions[sys.intern(action_name)] = action_handler
 
-    return actions
+    return types.MappingProxyType(actions)
 
 
 # Load them
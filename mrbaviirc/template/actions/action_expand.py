@@ -6,6 +6,8 @@ __copyright__ = "Copyright 2016-2019"
 __license__ = "Apache License 2.0"
 
 
+import itertools
+
 from . import ActionHandler
 from ..nodes import Node
 from ..errors import TemplateError, ParserError
@@ -52,21 +54,19 @@ class ExpandActionHandler(ActionHandler):
             (start, end) = segments[0]
             expr = parser.parse_expr(start, end)
 
-        for segment in segments[1:]:
-            (start, end) = segment
-
+        for (seg_start, seg_end) in itertools.islice(segments, 1, None):
             # Only support "into"
-            parser.get_expected_token(start, end, Token.TYPE_WORD, values="into")
-            start += 1
+            parser.get_expected_token(seg_start, seg_end, Token.TYPE_WORD, values="into")
+            seg_start += 1
 
             # Get variable type
             token = parser.get_expected_token(
-                start,
-                end,
+                seg_start,
+                seg_end,
                 Token.TYPE_WORD,
                 values=["local", "global", "private", "return", "app"]
             )
-            start += 1
+            seg_start += 1
 
             where = {
                 "local": RenderState.LOCAL_VAR,
@@ -76,7 +76,7 @@ class ExpandActionHandler(ActionHandler):
                 "app": RenderState.APP_VAR
             }.get(token.value, RenderState.LOCAL_VAR)
 
-            parser.get_no_more_tokens(start, end)
+            parser.get_no_more_tokens(seg_start, seg_end)
 
         if expr is None:
             raise ParserError(
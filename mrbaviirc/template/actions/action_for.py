@@ -37,16 +37,26 @@ class ForIterNode(Node):
         values = self.expr.eval(state)
         do_else = True
         if values:
-            index = 0
-            for var in values:
-                do_else = False
-                if self.cvar:
-                    state.set_var(self.cvar[0], index, self.cvar[1])
-                state.set_var(self.var[0], var, self.var[1])
-                index += 1
-
-                # Execute each sub-node
-                result = self.for_nodes.render(state)
+            set_var = state.set_var
+            render = self.for_nodes.render
+            (name, where) = self.var
+
+            if self.cvar:
+                (cname, cwhere) = self.cvar
+                for (index, var) in enumerate(values):
+                    do_else = False
+                    set_var(cname, index, cwhere)
+                    set_var(name, var, where)
+
+                    # Execute each sub-node
+                    render(state)
+            else:
+                for var in values:
+                    do_else = False
+                    set_var(name, var, where)
+
+                    # Execute each sub-node
+                    render(state)
 
         if do_else and self.else_nodes:
             return self.else_nodes.render(state)
@@ -73,21 +83,26 @@ class ForIncrNode(Node):
 
     def render(self, state):
         """ Render the for node. """
+        set_var = state.set_var
+        test = self.test.eval
+        render = self.for_nodes.render
+        incr = self.incr
+
         # Init
         for (var, expr) in self.init:
-            state.set_var(var[0], expr.eval(state), var[1])
+            set_var(var[0], expr.eval(state), var[1])
 
         # Test
         do_else = True
-        while bool(self.test.eval(state)):
+        while test(state):
             do_else = False
 
             # Render nodes
-            result = self.for_nodes.render(state)
+            render(state)
 
             # Incr
-            for (var, expr) in self.incr:
-                state.set_var(var[0], expr.eval(state), var[1])
+            for (var, expr) in incr:
+                set_var(var[0], expr.eval(state), var[1])
 
         if do_else and self.else_nodes:
             return self.else_nodes.render(state)
@@ -131,7 +146,7 @@ class ForActionHandler(ActionHandler):
 
         parser.add_node(node)
         parser.push_nodestack(node.nodes)
-        parser.push_handler(ForSubHandler(self.parser, self.template))
+        parser.push_handler(parser.get_handler(ForSubHandler))
 
     def handle_action_for(self, line, start, end):
         """ Handle a for incrementer """
@@ -160,7 +175,7 @@ class ForActionHandler(ActionHandler):
         node = ForIncrNode(self.template, line, init, test, incr)
         parser.add_node(node)
         parser.push_nodestack(node.nodes)
-        parser.push_handler(ForSubHandler(self.parser, self.template))
+        parser.push_handler(parser.get_handler(ForSubHandler))
 
 
 class ForSubHandler(DefaultActionHandler):
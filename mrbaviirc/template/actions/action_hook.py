@@ -6,6 +6,8 @@ __copyright__ = "Copyright 2016-2019"
 __license__ = "Apache License 2.0"
 
 
+import itertools
+
 from . import ActionHandler
 from ..nodes import Node
 from ..tokenizer import Token
@@ -26,12 +28,17 @@ class HookNode(Node):
         """ Expand the variables. """
 
         hook = self.hook.eval(state)
+        env = self.env
+        if not env.has_hook(hook):
+            # Nothing to call, so the parameters are not evaluated
+            return
+
         params = {}
         for (name, expr) in self.assigns:
             params[name] = expr.eval(state)
 
         state.line = self.line
-        self.env.call_hook(hook, state, params, self.reverse)
+        env.call_hook(hook, state, params, self.reverse)
 
 
 class HookActionHandler(ActionHandler):
@@ -56,14 +63,17 @@ class HookActionHandler(ActionHandler):
             (start, end) = segments[0]
             hook = self.parser.parse_expr(start, end)
 
-        for segment in segments[1:]:
-            (start, end) = segment
-
+        for (seg_start, seg_end) in itertools.islice(segments, 1, None):
             # Only support "with"
-            token = self.parser.get_expected_token(start, end, Token.TYPE_WORD, values="with")
-            start += 1
+            token = self.parser.get_expected_token(
+                seg_start,
+                seg_end,
+                Token.TYPE_WORD,
+                values="with"
+            )
+            seg_start += 1
 
-            assigns = self.parser.parse_multi_assign(start, end)
+            assigns = self.parser.parse_multi_assign(seg_start, seg_end)
 
         if hook is None:
             raise ParserError(
@@ -51,7 +51,7 @@ class IfActionHandler(ActionHandler):
 
         self.parser.add_node(node)
         self.parser.push_nodestack(node.nodes)
-        self.parser.push_handler(IfSubHandler(self.parser, self.template))
+        self.parser.push_handler(self.parser.get_handler(IfSubHandler))
 
 
 class IfSubHandler(DefaultActionHandler):
@@ -6,6 +6,8 @@ __copyright__ = "Copyright 2016-2019"
 __license__ = "Apache License 2.0"
 
 
+import itertools
+
 from . import ActionHandler
 from ..nodes import Node
 from ..tokenizer import Token
@@ -62,31 +64,29 @@ class IncludeActionHandler(ActionHandler):
             (start, end) = segments[0]
             expr = parser.parse_expr(start, end)
 
-        for segment in segments[1:]:
-            (start, end) = segment
-
+        for (seg_start, seg_end) in itertools.islice(segments, 1, None):
             token = parser.get_expected_token(
-                start,
-                end,
+                seg_start,
+                seg_end,
                 Token.TYPE_WORD,
                 values=["return", "with"]
             )
-            start += 1
+            seg_start += 1
 
             if token.value == "return":
-                retvar = parser.get_token_var(start, end, allow_type=True)
-                start += 1
+                retvar = parser.get_token_var(seg_start, seg_end, allow_type=True)
+                seg_start += 1
 
-                parser.get_no_more_tokens(start, end)
+                parser.get_no_more_tokens(seg_start, seg_end)
                 continue
 
             if token.value == "with":
-                assigns = parser.parse_multi_assign(start, end)
+                assigns = parser.parse_multi_assign(seg_start, seg_end)
                 continue
 
             # neither return or with, so expression
-            start -= 1
-            expr = parser.parse_expr(start, end)
+            seg_start -= 1
+            expr = parser.parse_expr(seg_start, seg_end)
 
         if expr is None:
             raise ParserError(
@@ -71,7 +71,7 @@ class SaveActionHandler(ActionHandler):
         node = SaveNode(self.template, line, saves)
         parser.add_node(node)
         parser.push_nodestack(node.nodes)
-        parser.push_handler(SaveSubHandler(self.parser, self.template))
+        parser.push_handler(parser.get_handler(SaveSubHandler))
 
 
 ACTION_HANDLERS = {"save": SaveActionHandler}
@@ -26,14 +26,14 @@ class SectionNode(Node):
         """
 
         section = str(self.expr.eval(state))
-        new_renderer = state.push_renderer()
+        new_renderer = state._push_capture() # pylint: disable=protected-access
         try:
             self.nodes.render(state)
             contents = new_renderer.get()
 
             state.append_section(section, contents)
         finally:
-            state.pop_renderer()
+            state._pop_capture() # pylint: disable=protected-access
 
 
 class SectionActionHandler(ActionHandler):
@@ -46,7 +46,7 @@ class SectionActionHandler(ActionHandler):
         node = SectionNode(self.template, line, expr)
         self.parser.add_node(node)
         self.parser.push_nodestack(node.nodes)
-        self.parser.push_handler(SectionSubHandler(self.parser, self.template))
+        self.parser.push_handler(self.parser.get_handler(SectionSubHandler))
 
 
 class SectionSubHandler(DefaultActionHandler):
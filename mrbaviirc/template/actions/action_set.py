@@ -7,37 +7,57 @@ __copyright__ = "Copyright 2016-2019"
 __license__ = "Apache License 2.0"
 
 
+import itertools
+
 from . import ActionHandler
 from ..nodes import Node
-from ..errors import Error
+from ..errors import Error, ParserError
 from ..tokenizer import Token
 
 
 class AssignNode(Node):
     """ Set a variable to a subvariable. """
+    __slots__ = ("assigns",)
 
-    def __init__(self, template, line, assigns, elses):
-        """ Initialize. """
+    def __init__(self, template, line, assigns):
+        """ Initialize.
+
+        The assigns are a sequence of (name, where, expr) entries.
+        """
         Node.__init__(self, template, line)
         self.assigns = assigns
-        self.elses = elses
 
     def render(self, state):
         """ Set the value. """
 
-        # An exception from assigns only passes up if there are no
-        # thens and no elses expressions
+        set_var = state.set_var
+        for (name, where, expr) in self.assigns:
+            set_var(name, expr.eval(state), where)
+
+
+class AssignWithElseNode(AssignNode):
+    """ Set variables, falling back to the else assignments on error. """
+    __slots__ = ("elses",)
+
+    def __init__(self, template, line, assigns, elses):
+        """ Initialize.
+
+        Both assigns and elses are sequences of (name, where, expr) entries.
+        """
+        AssignNode.__init__(self, template, line, assigns)
+        self.elses = elses
 
+    def render(self, state):
+        """ Set the value. """
+
+        set_var = state.set_var
         try:
-            for (var, expr) in self.assigns:
-                state.set_var(var[0], expr.eval(state), var[1])
-        except Error as e:
-            # An expression error occurred, run elses or reraise error
-            if self.elses is not None:
-                for (var, expr) in self.elses:
-                    state.set_var(var[0], expr.eval(state), var[1])
-            else:
-                raise
+            for (name, where, expr) in self.assigns:
+                set_var(name, expr.eval(state), where)
+        except Error:
+            # An expression error occurred, run elses instead
+            for (name, where, expr) in self.elses:
+                set_var(name, expr.eval(state), where)
 
 
 class SetActionHandler(ActionHandler):
@@ -48,38 +68,38 @@ class SetActionHandler(ActionHandler):
 
         parser = self.parser
         segments = parser.find_tag_segments(start, end)
-        assigns = None
-        elses = None
+        if not segments:
+            raise ParserError(
+                "Set expecting expressions",
+                self.template.filename,
+                line
+            )
 
         # Normal assignments are first
-        if len(segments) > 0:
-            (start, end) = segments[0]
-            assigns = self.parser.parse_multi_assign(start, end, allow_type=True)
+        (start, end) = segments[0]
+        assigns = parser.parse_multi_assign(start, end, allow_type=True)
+        elses = None
 
         # Find then/else assignments
-        for segment in segments[1:]:
-            (start, end) = segment
-
+        for (seg_start, seg_end) in itertools.islice(segments, 1, None):
             token = parser.get_expected_token(
-                start,
-                end,
+                seg_start,
+                seg_end,
                 Token.TYPE_WORD,
                 values=["else"]
             )
-            start += 1
+            seg_start += 1
 
             if token.value == "else":
-                elses = parser.parse_multi_assign(start, end, allow_type=True)
+                elses = parser.parse_multi_assign(seg_start, seg_end, allow_type=True)
+                elses = [(var[0], var[1], expr) for (var, expr) in elses]
                 continue
 
-        if assigns is None:
-            raise ParserError(
-                "Set expecting expressions",
-                self.template.filename,
-                line
-            )
-
-        node = AssignNode(self.template, line, assigns, elses)
+        assigns = [(var[0], var[1], expr) for (var, expr) in assigns]
+        if elses is None:
+            node = AssignNode(self.template, line, assigns)
+        else:
+            node = AssignWithElseNode(self.template, line, assigns, elses)
         self.parser.add_node(node)
 
 
@@ -37,22 +37,25 @@ class StripActionHandler(ActionHandler):
             value = None
 
         parser.push_autostrip(value)
-        parser.push_handler(StripSubHandler(self.parser, self.template))
+        parser.push_handler(parser.get_handler(StripSubHandler))
 
     def handle_action_autostrip(self, line, start, end):
         """ Handle autostrip """
-        self.parser.get_no_more_tokens(start, end)
-        self.parser.set_autostrip(self.parser.AUTOSTRIP_STRIP)
+        self._set_autostrip(start, end, self.parser.AUTOSTRIP_STRIP)
 
     def handle_action_autotrim(self, line, start, end):
         """ Handle autotrim """
-        self.parser.get_no_more_tokens(start, end)
-        self.parser.set_autostrip(self.parser.AUTOSTRIP_TRIM)
+        self._set_autostrip(start, end, self.parser.AUTOSTRIP_TRIM)
 
     def handle_action_no_autostrip(self, line, start, end):
         """ Handle no_autostrip """
-        self.parser.get_no_more_tokens(start, end)
-        self.parser.set_autostrip(self.parser.AUTOSTRIP_NONE)
+        self._set_autostrip(start, end, self.parser.AUTOSTRIP_NONE)
+
+    def _set_autostrip(self, start, end, value):
+        """ Check for no more tokens and set the autostrip value. """
+        parser = self.parser
+        parser.get_no_more_tokens(start, end)
+        parser.set_autostrip(value)
 
 
 class StripSubHandler(DefaultActionHandler):
@@ -61,9 +64,10 @@ class StripSubHandler(DefaultActionHandler):
     def handle_action_endstrip(self, line, start, end):
         """ Handle nested action tags """
 
-        self.parser.get_no_more_tokens(start, end)
-        self.parser.pop_autostrip()
-        self.parser.pop_handler()
+        parser = self.parser
+        parser.get_no_more_tokens(start, end)
+        parser.pop_autostrip()
+        parser.pop_handler()
 
 
 ACTION_HANDLERS = {
@@ -8,22 +8,60 @@ __license__ = "Apache License 2.0"
 
 from . import ActionHandler, DefaultActionHandler
 from ..nodes import Node, NodeList
+from ..expr import ValueExpr
 from ..errors import ParserError
 
 
+def _lt(value, test):
+    """ Test if value is less than test. """
+    return value < test
+
+def _le(value, test):
+    """ Test if value is less than or equal to test. """
+    return value <= test
+
+def _gt(value, test):
+    """ Test if value is greater than test. """
+    return value > test
+
+def _ge(value, test):
+    """ Test if value is greater than or equal to test. """
+    return value >= test
+
+def _ne(value, test):
+    """ Test if value is not equal to test. """
+    return value != test
+
+def _eq(value, test):
+    """ Test if value is equal to test. """
+    return value == test
+
+def _bt(value, low, high):
+    """ Test if value is between low and high inclusive. """
+    return low <= value <= high
+
+
+# Types whose hash and == agree, so a dict lookup matches as _eq would
+_JUMP_TYPES = frozenset([str, int, float, bool])
+
+
 class SwitchNode(Node):
     """ A node for basic if/elif/elif/else nesting. """
-    types = ["lt", "le", "gt", "ge", "ne", "eq", "bt"]
-    argc = [1, 1, 1, 1, 1, 1, 2]
-    cbs = [
-        lambda *args: args[0] < args[1],
-        lambda *args: args[0] <= args[1],
-        lambda *args: args[0] > args[1],
-        lambda *args: args[0] >= args[1],
-        lambda *args: args[0] != args[1],
-        lambda *args: args[0] == args[1],
-        lambda *args: args[0] >= args[1] and args[0] <= args[2]
-    ]
+    __slots__ = (
+        "expr", "default_nodes", "cases_nodes", "nodes", "eq_values",
+        "cases_render", "default_render", "jump_table"
+    )
+
+    # Map of case action to (argument count, test function)
+    cases = {
+        "lt": (1, _lt),
+        "le": (1, _le),
+        "gt": (1, _gt),
+        "ge": (1, _ge),
+        "ne": (1, _ne),
+        "eq": (1, _eq),
+        "bt": (2, _bt)
+    }
 
     def __init__(self, template, line, expr):
         """ Initialize the switch node. """
@@ -33,21 +71,85 @@ class SwitchNode(Node):
         self.cases_nodes = []
         self.nodes = self.default_nodes
 
+        # Constant values of eq cases, or None once any other case is added
+        self.eq_values = []
+
+        # Set by finalize
+        self.cases_render = []
+        self.default_render = None
+        self.jump_table = None
+
     def add_case(self, testfunc, exprs):
-        """ Add a case node. """
-        self.cases_nodes.append((testfunc, NodeList(), exprs))
+        """ Add a case node.
+
+        The test function and its expressions are combined into a single
+        predicate taking the state and the switch value.  Constant case
+        values are captured directly instead of being evaluated each render.
+        """
+        constant = all(isinstance(expr, ValueExpr) for expr in exprs)
+
+        if self.eq_values is not None:
+            if constant and testfunc is _eq:
+                self.eq_values.append(exprs[0].value)
+            else:
+                self.eq_values = None
+
+        if len(exprs) == 1:
+            if constant:
+                test = exprs[0].value
+                def predicate(state, value):
+                    return testfunc(value, test)
+            else:
+                expr = exprs[0]
+                def predicate(state, value):
+                    return testfunc(value, expr.eval(state))
+        else:
+            # Only the between test takes two arguments
+            if constant:
+                (low, high) = (expr.value for expr in exprs)
+                def predicate(state, value):
+                    return low <= value <= high
+            else:
+                (low, high) = exprs
+                def predicate(state, value):
+                    return low.eval(state) <= value <= high.eval(state)
+
+        self.cases_nodes.append((predicate, NodeList()))
         self.nodes = self.cases_nodes[-1][1]
 
+    def finalize(self):
+        """ Called once all cases have been added. """
+        self.cases_render = [
+            (predicate, nodes.get_render())
+            for (predicate, nodes) in self.cases_nodes
+        ]
+        self.default_render = self.default_nodes.get_render()
+
+        # A switch made only of constant eq cases can look up the case
+        # directly.  The first case for a value wins, as with the loop.
+        # A dict matches by hash and then ==, so the table is only built
+        # for, and only used with, plain values where that is the same
+        # as comparing with ==.
+        eq_values = self.eq_values
+        if eq_values and all(type(test) in _JUMP_TYPES for test in eq_values):
+            jump_table = {}
+            for (test, (_, render)) in zip(eq_values, self.cases_render):
+                jump_table.setdefault(test, render)
+            self.jump_table = jump_table
+
     def render(self, state):
         """ Render the node. """
         value = self.expr.eval(state)
 
-        for testfunc, nodes, exprs in self.cases_nodes:
-            params = [expr.eval(state) for expr in exprs]
-            if testfunc(value, *params):
-                return nodes.render(state)
+        if self.jump_table is not None and type(value) in _JUMP_TYPES:
+            render = self.jump_table.get(value, self.default_render)
+            return render(state)
 
-        return self.default_nodes.render(state)
+        for (predicate, render) in self.cases_render:
+            if predicate(state, value):
+                return render(state)
+
+        return self.default_render(state)
 
 
 class SwitchActionHandler(ActionHandler):
@@ -60,7 +162,7 @@ class SwitchActionHandler(ActionHandler):
         node = SwitchNode(self.template, line, expr)
         self.parser.add_node(node)
         self.parser.push_nodestack(node.nodes)
-        self.parser.push_handler(SwitchSubHandler(self.parser, self.template))
+        self.parser.push_handler(self.parser.get_handler(SwitchSubHandler))
 
 
 class SwitchSubHandler(DefaultActionHandler):
@@ -70,10 +172,9 @@ class SwitchSubHandler(DefaultActionHandler):
         # override handle_action
         """ Handle nested tags """
 
-        if action in SwitchNode.types:
-            offset = SwitchNode.types.index(action)
-            argc = SwitchNode.argc[offset]
-
+        case = SwitchNode.cases.get(action)
+        if case is not None:
+            (argc, testfunc) = case
             exprs = self.parser.parse_multi_expr(start, end)
 
             if len(exprs) != argc:
@@ -84,7 +185,7 @@ class SwitchSubHandler(DefaultActionHandler):
                 )
 
             node = self.parser.pop_nodestack()
-            node.add_case(SwitchNode.cbs[offset], exprs)
+            node.add_case(testfunc, exprs)
             self.parser.push_nodestack(node.nodes)
 
         else:
@@ -93,7 +194,8 @@ class SwitchSubHandler(DefaultActionHandler):
     def handle_action_endswitch(self, line, start, end):
         """ Handle endswitch """
         self.parser.get_no_more_tokens(start, end)
-        self.parser.pop_nodestack()
+        node = self.parser.pop_nodestack()
+        node.finalize()
         self.parser.pop_handler()
 
 
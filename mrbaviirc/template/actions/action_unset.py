@@ -12,6 +12,7 @@ from ..nodes import Node
 
 class UnsetNode(Node):
     """ Unset variables. """
+    __slots__ = ("varlist",)
 
     def __init__(self, template, line, varlist):
         """ Initialize. """
@@ -20,8 +21,9 @@ class UnsetNode(Node):
 
     def render(self, state):
         """ Set the value. """
-        for item in self.varlist:
-            state.unset_var(item[0], item[1])
+        unset_var = state.unset_var
+        for (name, where) in self.varlist:
+            unset_var(name, where)
 
 
 class UnsetActionHandler(ActionHandler):
@@ -8,10 +8,12 @@ __license__ = "Apache License 2.0"
 
 from . import ActionHandler
 from ..nodes import Node
+from ..expr import ValueExpr
 
 
 class UseSectionNode(Node):
     """ A node to use a section in the output. """
+    __slots__ = ("expr",)
 
     def __init__(self, template, line, expr):
         """ Initialize. """
@@ -25,6 +27,20 @@ class UseSectionNode(Node):
         state.renderer.render(state.get_section(section))
 
 
+class ConstUseSectionNode(Node):
+    """ A node to use a section whose name is known when parsing. """
+    __slots__ = ("section",)
+
+    def __init__(self, template, line, section):
+        """ Initialize. """
+        Node.__init__(self, template, line)
+        self.section = section
+
+    def render(self, state):
+        """ Render the section to the output. """
+        state.renderer.render(state.get_section(self.section))
+
+
 class UseActionHandler(ActionHandler):
     """ Handle the use action """
 
@@ -32,7 +48,10 @@ class UseActionHandler(ActionHandler):
         """ Handle use """
         expr = self.parser.parse_expr(start, end)
 
-        node = UseSectionNode(self.template, line, expr)
+        if isinstance(expr, ValueExpr):
+            node = ConstUseSectionNode(self.template, line, str(expr.value))
+        else:
+            node = UseSectionNode(self.template, line, expr)
         self.parser.add_node(node)
 
 
@@ -7,29 +7,43 @@ __license__ = "Apache License 2.0"
 
 
 from . import ActionHandler, DefaultActionHandler
-from ..nodes import Node, NodeList
-from ..renderers import StringRenderer
+from ..nodes import Node, NodeList, TextNode
 
 
 class VarNode(Node):
     """ Capture output into a variable. """
+    __slots__ = ("var", "nodes", "text")
 
     def __init__(self, template, line, var):
         """ Initialize. """
         Node.__init__(self, template, line)
         self.var = var
         self.nodes = NodeList()
+        self.text = None
+
+    def finalize(self):
+        """ Called once all child nodes have been added.
+
+        If the contents are only text, the result is known ahead of time and
+        can be assigned without rendering into a temporary renderer.
+        """
+        if all(isinstance(node, TextNode) for node in self.nodes.nodes):
+            self.text = "".join(node.text for node in self.nodes.nodes)
 
     def render(self, state):
         """ Render the results and capture into a variable. """
 
-        new_renderer = state.push_renderer()
+        if self.text is not None:
+            state.set_var(self.var[0], self.text, self.var[1])
+            return
+
+        new_renderer = state._push_capture()
         try:
             self.nodes.render(state)
             contents = new_renderer.get()
             state.set_var(self.var[0], contents, self.var[1])
         finally:
-            state.pop_renderer()
+            state._pop_capture()
 
 
 class VarActionHandler(ActionHandler):
@@ -45,7 +59,7 @@ class VarActionHandler(ActionHandler):
         node = VarNode(self.template, line, var)
         self.parser.add_node(node)
         self.parser.push_nodestack(node.nodes)
-        self.parser.push_handler(VarSubHandler(self.parser, self.template))
+        self.parser.push_handler(self.parser.get_handler(VarSubHandler))
 
 
 class VarSubHandler(DefaultActionHandler):
@@ -54,7 +68,8 @@ class VarSubHandler(DefaultActionHandler):
     def handle_action_endvar(self, line, start, end):
         """ endvar """
         self.parser.get_no_more_tokens(start, end)
-        self.parser.pop_nodestack()
+        node = self.parser.pop_nodestack()
+        node.finalize()
         self.parser.pop_handler()
 
 
@@ -15,12 +15,21 @@ from .loaders import UnrestrictedLoader
 
 from .lib import StandardLib
 
+
+_MISSING = object()
+_NO_HOOKS = ((), ())
+
+
 class Environment(object):
     """ Represent a template environment.
 
     This class servers as the main container for a template environment,
     storing the loaders, imports, registered hooks, etc.
     """
+    __slots__ = (
+        "_importers", "_imported", "_hooks", "_lock", "_loader",
+        "_load_template", "_fix_load_text", "__weakref__"
+    )
 
     def __init__(self, loader=None, importers=None):
         """ Initialize the template environment.
@@ -42,7 +51,7 @@ class Environment(object):
             "mrbaviirc.template": StandardLib
         }
         self._imported = {}
-        self._hooks = {}
+        self._hooks = {} # name -> (callbacks, reversed callbacks)
         self._lock = threading.Lock()
 
         if loader:
@@ -50,6 +59,9 @@ class Environment(object):
         else:
             self._loader = UnrestrictedLoader()
 
+        self._load_template = self._loader.load_template
+        self._fix_load_text = self._loader.fix_load_text
+
         if importers:
             self._importers.update(importers)
 
@@ -96,7 +108,9 @@ class Environment(object):
                 params : list
                     A list of evaluated parameters passed to the hook
         """
-        self._hooks.setdefault(name, []).append(callback)
+        (callbacks, _) = self._hooks.get(name, ((), ()))
+        callbacks += (callback,)
+        self._hooks[name] = (callbacks, callbacks[::-1])
 
     def load_file(self, filename, parent=None):
         """ Load a template from a file.
@@ -115,7 +129,7 @@ class Environment(object):
         Returns
         -------
         template.Template:
-            The loaded or cached template.
+            The loaded or cached template.  Caching is done by the loader.
 
         Raises
         ------
@@ -126,7 +140,7 @@ class Environment(object):
         Exception:
             Any other exceptions such as IO/OS errors.
         """
-        return self._loader.load_template(self, filename, parent)
+        return self._load_template(self, filename, parent)
 
     def load_text(self, text, filename=""):
         """ Load a template direct from text.
@@ -152,9 +166,13 @@ class Environment(object):
             Another exception occurred
         """
         template = Template(self, text, filename)
-        self._loader.fix_load_text(template)
+        self._fix_load_text(template)
         return template
 
+    def clear_cache(self):
+        """ Clear the cached templates of the loader. """
+        self._loader.clear_cache()
+
     def load_import(self, name):
         """ Internal use only.  Load an import by name and cache the value.
 
@@ -173,14 +191,33 @@ class Environment(object):
         KeyError
             Raised if the named importer does not exist.
         """
+        # Imports are never removed once loaded, so only a miss needs the lock
+        imported = self._imported.get(name, _MISSING)
+        if imported is not _MISSING:
+            return imported
+
         with self._lock:
-            if not name in self._imported:
-                if not name in self._importers:
-                    raise KeyError(name)
+            imported = self._imported.get(name, _MISSING)
+            if imported is _MISSING:
+                imported = self._importers[name]()
+                self._imported[name] = imported
+
+            return imported
+
+    def has_hook(self, hook):
+        """ Internal use only.  Test if any callbacks are registered for a hook.
 
-                self._imported[name] = self._importers[name]()
+        Parameters
+        ----------
+        hook : str
+            The name of the hook
 
-            return self._imported[name]
+        Returns
+        -------
+        bool
+            True if at least one callback is registered for the hook
+        """
+        return hook in self._hooks
 
     def call_hook(self, hook, state, params, reverse):
         """ Internal use only.  Call hooks from a template.
@@ -201,12 +238,6 @@ class Environment(object):
             If True, the hook fuctions are called in the reverse order in which
             they were registered. Otherwise they are called in order.
         """
-        callbacks = self._hooks.get(hook, None)
-        if callbacks is None:
-            return
-
-        if reverse:
-            callbacks = reversed(callbacks)
-
+        callbacks = self._hooks.get(hook, _NO_HOOKS)[1 if reverse else 0]
         for callback in callbacks:
             callback(state, params)
@@ -16,6 +16,7 @@ class Error(Exception):
     message : str
         The exception message.
     """
+    __slots__ = ("message",)
 
     def __init__(self, message):
         """ Initialize the exception.
@@ -45,10 +46,12 @@ class RestrictedError(Error):
     This exception is raised when restriction-related errors occur such as
     accessing a template outside of the template path.
     """
+    __slots__ = ()
 
 
 class AbortError(Error):
     """ Represent an aborted template render. """
+    __slots__ = ()
 
 
 class TemplateError(Error):
@@ -61,6 +64,7 @@ class TemplateError(Error):
     line : int
         The line where the error occured.
     """
+    __slots__ = ("filename", "line")
 
     def __init__(self, message, filename, line):
         """ Initialze the template error.
@@ -85,19 +89,24 @@ class TemplateError(Error):
 
 class ParserError(TemplateError):
     """ Represent a parsing syntax error in the template. """
+    __slots__ = ()
 
 
 class UnknownVariableError(TemplateError):
     """ Represent an unknown variable access. """
+    __slots__ = ()
 
 
 class UnknownIndexError(TemplateError):
     """ Represent an unknown index into a variable. """
+    __slots__ = ()
 
 
 class UnknownImportError(TemplateError):
     """ Represent an import of an unknown name. """
+    __slots__ = ()
 
 
 class RaisedError(TemplateError):
     """ Represent an error raised from the template itself. """
+    __slots__ = ()
@@ -7,17 +7,20 @@ __license__ = "Apache License 2.0"
 __all__ = [
     "Expr", "ValueExpr", "FuncExpr", "ListExpr", "DictExpr", "VarExpr",
     "LookupAttrExpr", "LookupItemExpr", "LookupSliceExpr", "BooleanBinaryExpr",
-    "BinaryExpr", "AndExpr", "OrExpr", "BooleanUnaryExpr", "UnaryExpr"
+    "BinaryExpr", "NaryExpr", "AndExpr", "OrExpr", "BooleanUnaryExpr", "UnaryExpr"
 ]
 
 
+import operator
 import weakref
 
 from .errors import UnknownVariableError, UnknownIndexError
+from .util import FOLD_OPERATORS, FOLD_MAX_STRING, fold_string_size
 
 
 class Expr:
     """ Base for an expression object. """
+    __slots__ = ("_template", "_filename", "line")
 
     def __init__(self, template, line):
         """ Initialize the expression object.
@@ -32,6 +35,7 @@ class Expr:
             The line number of the template that this expression is at.
         """
         self._template = weakref.ref(template)
+        self._filename = template.filename # For errors without the weakref
         self.line = line
 
     @property
@@ -67,6 +71,54 @@ class Expr:
         """
         raise NotImplementedError
 
+    def fold(self):
+        """ Return a simpler expression with the same result if possible.
+
+        This is called by the parser once an expression node is created, so
+        the child expressions have already been folded.  Nodes only fold
+        when their direct children are constant.
+
+        Returns
+        -------
+        mrbaviirc.template.expr.Expr
+            A ValueExpr with the precomputed result, or the node itself.
+        """
+        return self
+
+    def _fold_value(self, oper, *exprs):
+        """ Fold to the result of an operator applied to constant expressions.
+
+        Parameters
+        ----------
+        oper : callable
+            The operator to call with the values of the expressions
+        exprs : mrbaviirc.template.expr.Expr
+            The expressions whose values are passed to the operator
+
+        Returns
+        -------
+        mrbaviirc.template.expr.Expr
+            A ValueExpr with the result, or the node itself if the operator
+            is not known to be safe, any expression is not constant, or the
+            operator raised an error which should instead happen at render.
+        """
+        if oper not in FOLD_OPERATORS:
+            return self
+
+        if not all(isinstance(expr, ValueExpr) for expr in exprs):
+            return self
+
+        values = tuple(expr.value for expr in exprs)
+        if fold_string_size(oper, values) > FOLD_MAX_STRING:
+            return self
+
+        try:
+            value = oper(*values)
+        except Exception: # pylint: disable=broad-except
+            return self
+
+        return ValueExpr(self.template, self.line, value)
+
 
 class ValueExpr(Expr):
     """ An expression that represents a value.
@@ -74,6 +126,7 @@ class ValueExpr(Expr):
         returns the value.  Else a template item may mutate the value in the
         node and a later assigmnet may have an unexpcted value.
     """
+    __slots__ = ("value",)
 
     def __init__(self, template, line, value):
         """ Initialize the value expression.
@@ -107,6 +160,7 @@ class ValueExpr(Expr):
 
 class FuncExpr(Expr):
     """ A function expression node. """
+    __slots__ = ("expr", "nodes", "namednodes", "_evals", "_arity")
 
     def __init__(self, template, line, expr, nodes):
         """ Initialize the node.
@@ -127,20 +181,26 @@ class FuncExpr(Expr):
         """
         Expr.__init__(self, template, line)
         self.expr = expr
-        self.nodes = list(expr for (var, expr) in nodes if var is None)
-        self.namednodes = list((var, expr) for (var, expr) in nodes if var is not None)
+        positional = []
+        named = []
+        for (var, node) in nodes:
+            if var is None:
+                positional.append(node)
+            else:
+                named.append((var, node))
+
+        self.nodes = tuple(positional)
+        self.namednodes = tuple(named)
+        self._evals = tuple(node.eval for node in positional)
+
+        # Number of positional parameters, or -1 to use the generic call
+        self._arity = len(positional) if not named else -1
 
     def eval(self, state):
         """ Evaluate the function call and return the results.
 
-        If the function evaluates to an instance of a class derived from
-        mrbaviirc.template.util.sepcialfunction, then the the function call
-        directly passes the state and the unevaluated parameter nodes.  This
-        allows for creation of special functions that can catch exceptions in
-        evaluation of paremters and return a result accordingly.
-
-        In other cases, the function is called with the parameters from the
-        template evaluated then passed, without any state object.
+        The function is called with the parameters from the template
+        evaluated then passed, without any state object.
 
         Parameters
         ----------
@@ -159,13 +219,30 @@ class FuncExpr(Expr):
             variables, any exception may be raised from within those functions.
         """
         func = self.expr.eval(state)
-        params = [node.eval(state) for node in self.nodes]
-        namedparams = {var: node.eval(state) for (var, node) in self.namednodes}
-        return func(*params, **namedparams)
+        evals = self._evals
+
+        # Most calls have a few positional parameters, call those directly
+        arity = self._arity
+        if arity == 0:
+            return func()
+        if arity == 1:
+            return func(evals[0](state))
+        if arity == 2:
+            return func(evals[0](state), evals[1](state))
+        if arity == 3:
+            return func(evals[0](state), evals[1](state), evals[2](state))
+
+        params = [fn(state) for fn in evals]
+        if arity < 0:
+            namedparams = {var: node.eval(state) for (var, node) in self.namednodes}
+            return func(*params, **namedparams)
+
+        return func(*params)
 
 
 class ListExpr(Expr):
     """ A list expression node. """
+    __slots__ = ("nodes", "_values", "_evals")
 
     def __init__(self, template, line, nodes):
         """ Initialize the node.
@@ -183,6 +260,14 @@ class ListExpr(Expr):
         Expr.__init__(self, template, line)
         self.nodes = nodes
 
+        # A list of constants is copied from the values instead of evaluating
+        # each node.  It can't become a ValueExpr as the list may be modified.
+        if all(isinstance(node, ValueExpr) for node in nodes):
+            self._values = tuple(node.value for node in nodes)
+        else:
+            self._values = None
+        self._evals = tuple(node.eval for node in nodes)
+
     def eval(self, state):
         """ Evaluate the expression.
 
@@ -194,13 +279,17 @@ class ListExpr(Expr):
         Returns
         -------
         list
-            The list of evaluated items.
+            The list of evaluated items.  A new list is returned each time.
         """
-        return [node.eval(state) for node in self.nodes]
+        if self._values is not None:
+            return list(self._values)
+
+        return [fn(state) for fn in self._evals]
 
 
 class DictExpr(Expr):
     """ A dict expression node. """
+    __slots__ = ("key_nodes", "value_nodes", "_pairs")
 
     def __init__(self, template, line, key_nodes, value_nodes):
         """ Initialize the node.
@@ -221,6 +310,7 @@ class DictExpr(Expr):
         Expr.__init__(self, template, line)
         self.key_nodes = key_nodes
         self.value_nodes = value_nodes
+        self._pairs = tuple(zip(key_nodes, value_nodes))
 
     def eval(self, state):
         """ Evaluate the expression.
@@ -235,14 +325,12 @@ class DictExpr(Expr):
         A dictionary containing the key to value results from evaluating the
         pairs of keys and values.
         """
-        return dict(zip(
-            (key.eval(state) for key in self.key_nodes),
-            (value.eval(state) for value in self.value_nodes)
-        ))
+        return {key.eval(state): value.eval(state) for (key, value) in self._pairs}
 
 
 class VarExpr(Expr):
     """ An expression that represents a variable. """
+    __slots__ = ("var", "_name", "_where")
 
     def __init__(self, template, line, var):
         """ Initialize the variable expression.
@@ -253,11 +341,12 @@ class VarExpr(Expr):
             See parent class
         line
             See parent class
-        var : str
-            The name of the variable to evaluate
+        var : tuple
+            The (name, where) of the variable to evaluate
         """
         Expr.__init__(self, template, line)
         self.var = var
+        (self._name, self._where) = var
 
     def eval(self, state):
         """ Evaluate the expression.
@@ -278,17 +367,22 @@ class VarExpr(Expr):
             If the variable was not found in the state
         """
         try:
-            return state.get_var(self.var[0], self.var[1])
+            return state.get_var(self._name, self._where)
         except KeyError:
             raise UnknownVariableError(
                 self.var,
-                self.template.filename,
+                self._filename,
                 self.line
             )
 
 
 class LookupAttrExpr(Expr):
-    """ An array index expression node. """
+    """ An attribute lookup expression node.
+
+    The parser merges a chain such as a.b.c into one node with extend, so
+    the whole chain is looked up within a single eval.
+    """
+    __slots__ = ("expr", "attr", "_steps")
 
     def __init__(self, template, line, expr, attr):
         """ Initialize the node.
@@ -302,11 +396,32 @@ class LookupAttrExpr(Expr):
         expr : mrbaviirc.template.expr.Expr
             The expression node to evaluate and find the attribute in
         attr : str
-            The name of the attribute
+            The name of the first attribute
         """
         Expr.__init__(self, template, line)
         self.expr = expr
         self.attr = attr
+        self._steps = ((operator.attrgetter(attr), attr, line),)
+
+    def extend(self, line, attr):
+        """ Return a node that also looks up an attribute of this result.
+
+        Parameters
+        ----------
+        line : int
+            The line of the attribute in the template
+        attr : str
+            The name of the attribute
+
+        Returns
+        -------
+        mrbaviirc.template.expr.LookupAttrExpr
+            A new node for the longer chain.  This node is unchanged.
+        """
+        node = LookupAttrExpr(self.template, self.line, self.expr, self.attr)
+        step = (operator.attrgetter(attr), attr, line)
+        node._steps = self._steps + (step,) # pylint: disable=protected-access
+        return node
 
     def eval(self, state):
         """ Evaluate the expression.
@@ -319,27 +434,32 @@ class LookupAttrExpr(Expr):
         Returns
         -------
         Any
-            The expression object is first evaluated. Then the attribute is
-            looked up within the object and returned if it exists.
+            The expression object is first evaluated. Then each attribute is
+            looked up in turn and the final value returned.
 
         Raises
         ------
         mrbaviirc.template.errors.UnknownVariableError
-            If the attribute could not be found
+            If an attribute could not be found.  The error names that
+            attribute and its line.
         """
         result = self.expr.eval(state)
-        try:
-            return getattr(result, self.attr)
-        except (TypeError, KeyError, IndexError, AttributeError):
-            raise UnknownVariableError(
-                self.attr,
-                self.template.filename,
-                self.line
-            )
+        for (getter, attr, line) in self._steps:
+            try:
+                result = getter(result)
+            except (TypeError, KeyError, IndexError, AttributeError):
+                raise UnknownVariableError(
+                    attr,
+                    self._filename,
+                    line
+                )
+
+        return result
 
 
 class LookupItemExpr(Expr):
     """ An array index expression node. """
+    __slots__ = ("expr", "item", "_key")
 
     def __init__(self, template, line, expr, item):
         """ Initialize the node.
@@ -359,6 +479,9 @@ class LookupItemExpr(Expr):
         self.expr = expr
         self.item = item
 
+        # A constant key such as x[0] or x["name"] is used without evaluating
+        self._key = (item.value,) if isinstance(item, ValueExpr) else None
+
     def eval(self, state):
         """ Evaluate the expression.
 
@@ -380,19 +503,21 @@ class LookupItemExpr(Expr):
             If the key or index is not found in the object.
         """
         result = self.expr.eval(state)
-        item = self.item.eval(state)
+        key = self._key
+        item = key[0] if key is not None else self.item.eval(state)
         try:
             return result[item]
         except (KeyError, IndexError, TypeError):
             raise UnknownIndexError(
                 item,
-                self.template.filename,
+                self._filename,
                 self.line
             )
 
 
 class LookupSliceExpr(Expr):
     """ An array index expression node. """
+    __slots__ = ("expr", "items", "_items", "_slice")
 
     def __init__(self, template, line, expr, items):
         """ Initialize the node.
@@ -412,6 +537,15 @@ class LookupSliceExpr(Expr):
         Expr.__init__(self, template, line)
         self.expr = expr
         self.items = items
+        self._items = tuple(items) + (None,) * (3 - len(items))
+
+        # A slice of constant values only needs to be created once
+        if all(item is None or isinstance(item, ValueExpr) for item in self._items):
+            self._slice = slice(*(
+                item.value if item is not None else None for item in self._items
+            ))
+        else:
+            self._slice = None
 
     def eval(self, state):
         """ Evaluate the expression.
@@ -435,22 +569,32 @@ class LookupSliceExpr(Expr):
 
         """
         result = self.expr.eval(state)
-        # Eval each slice item
-        parts = list(item.eval(state) if item is not None else None for item in self.items)
-        parts.extend([None, None, None]) # Ensure at least 3 parts
-        (start, stop, step) = parts[0:3]
+
+        lookup = self._slice
+        if lookup is None:
+            # Eval each slice item, the items are padded to 3 when parsed
+            (start, stop, step) = self._items
+            if start is not None:
+                start = start.eval(state)
+            if stop is not None:
+                stop = stop.eval(state)
+            if step is not None:
+                step = step.eval(state)
+
+            lookup = slice(start, stop, step)
 
         try:
-            return result[slice(start, stop, step)]
+            return result[lookup]
         except (KeyError, IndexError, TypeError):
             raise UnknownIndexError(
-                "{0},{1},{2}".format(str(start), str(stop), str(step)),
-                self.template.filename,
+                "{0},{1},{2}".format(str(lookup.start), str(lookup.stop), str(lookup.step)),
+                self._filename,
                 self.line
             )
 
 class BooleanBinaryExpr(Expr):
     """ Return boolean binary operation of two expressions. """
+    __slots__ = ("oper", "expr1", "expr2")
 
     def __init__(self, template, line, oper, expr1, expr2):
 
@@ -494,9 +638,18 @@ class BooleanBinaryExpr(Expr):
             self.expr2.eval(state)
         ))
 
+    def fold(self):
+        """ Fold a comparison of constant values. """
+        result = self._fold_value(self.oper, self.expr1, self.expr2)
+        if result is not self:
+            result.value = bool(result.value)
+
+        return result
+
 
 class BinaryExpr(Expr):
     """ Return binary operation of two expressions. """
+    __slots__ = ("oper", "expr1", "expr2")
 
     def __init__(self, template, line, oper, expr1, expr2):
         """ Initialize the node.
@@ -539,11 +692,91 @@ class BinaryExpr(Expr):
             self.expr2.eval(state)
         )
 
+    def fold(self):
+        """ Fold an operation on constant values.
+
+        A left-nested chain of the same operator, such as a + b + c, is
+        flattened into a single NaryExpr which evaluates in the same order.
+        """
+        result = self._fold_value(self.oper, self.expr1, self.expr2)
+        if result is not self:
+            return result
+
+        expr1 = self.expr1
+        if isinstance(expr1, BinaryExpr) and expr1.oper is self.oper:
+            return NaryExpr(
+                self.template,
+                self.line,
+                self.oper,
+                expr1.expr1,
+                (expr1.expr2, self.expr2)
+            )
+
+        if isinstance(expr1, NaryExpr) and expr1.oper is self.oper:
+            return NaryExpr(
+                self.template,
+                self.line,
+                self.oper,
+                expr1.expr1,
+                expr1.exprs + (self.expr2,)
+            )
+
+        return self
+
+
+class NaryExpr(Expr):
+    """ Return a binary operation applied left to right over expressions. """
+    __slots__ = ("oper", "expr1", "exprs", "_evals")
+
+    def __init__(self, template, line, oper, expr1, exprs):
+        """ Initialize the node.
+
+        Parameters
+        ----------
+        template
+            See parent class
+        line
+            See parent class
+        oper : callable
+            The callable to pass the results to
+        expr1 : mrbaviirc.template.expr.Expr
+            The leftmost expression
+        exprs : tuple
+            The remaining mrbaviirc.template.expr.Expr expressions, in order
+        """
+        Expr.__init__(self, template, line)
+        self.oper = oper
+        self.expr1 = expr1
+        self.exprs = exprs
+        self._evals = tuple(expr.eval for expr in exprs)
+
+    def eval(self, state):
+        """ Evaluate the expression.
+
+        Parameters
+        ----------
+        state
+            See parent class
+
+        Returns
+        -------
+        Any
+            The operator is called with the result so far and the result of
+            each following expression, the same as nested BinaryExpr nodes.
+        """
+        oper = self.oper
+        result = self.expr1.eval(state)
+        for fn in self._evals:
+            result = oper(result, fn(state))
+
+        return result
+
 
 class AndExpr(Expr):
     """ Return boolean AND of two expressions.
 
     This used instead of BinaryExpr to allow for shortcut evaluation. """
+    __slots__ = ("expr1", "expr2")
 
     def __init__(self, template, line, expr1, expr2):
         """ Initialize the node.
@@ -586,11 +819,30 @@ class AndExpr(Expr):
 
         return bool(result)
 
+    def fold(self):
+        """ Fold when the result is decided by constant values. """
+        if isinstance(self.expr1, ValueExpr):
+            if not self.expr1.value:
+                return ValueExpr(self.template, self.line, False)
+
+            if isinstance(self.expr2, ValueExpr):
+                return ValueExpr(self.template, self.line, bool(self.expr2.value))
+
+            # "true and x" is just the truth of x
+            return UnaryExpr(self.template, self.line, operator.truth, self.expr2)
+
+        if isinstance(self.expr2, ValueExpr) and self.expr2.value:
+            # "x and true" is just the truth of x
+            return UnaryExpr(self.template, self.line, operator.truth, self.expr1)
+
+        return self
+
 
 class OrExpr(Expr):
     """ Return boolean OR of two expressions.
 
     This used instead of BinaryExpr to allow for shortcut evaluation. """
+    __slots__ = ("expr1", "expr2")
 
     def __init__(self, template, line, expr1, expr2):
         """ Initialize the node.
@@ -633,9 +885,28 @@ class OrExpr(Expr):
 
         return bool(result)
 
+    def fold(self):
+        """ Fold when the result is decided by constant values. """
+        if isinstance(self.expr1, ValueExpr):
+            if self.expr1.value:
+                return ValueExpr(self.template, self.line, True)
+
+            if isinstance(self.expr2, ValueExpr):
+                return ValueExpr(self.template, self.line, bool(self.expr2.value))
+
+            # "false or x" is just the truth of x
+            return UnaryExpr(self.template, self.line, operator.truth, self.expr2)
+
+        if isinstance(self.expr2, ValueExpr) and not self.expr2.value:
+            # "x or false" is just the truth of x
+            return UnaryExpr(self.template, self.line, operator.truth, self.expr1)
+
+        return self
+
 
 class BooleanUnaryExpr(Expr):
     """ Return boolean binary operation of two expressions. """
+    __slots__ = ("oper", "expr1")
 
     def __init__(self, template, line, oper, expr1):
         """ Initialize the node.
@@ -676,6 +947,8 @@ class BooleanUnaryExpr(Expr):
 
 class UnaryExpr(Expr):
     """ Return binary operation of two expressions. """
+    __slots__ = ("oper", "expr1")
+
     def __init__(self, template, line, oper, expr1):
         """ Initialize the node.
 
@@ -710,3 +983,13 @@ class UnaryExpr(Expr):
         """
 
         return self.oper(self.expr1.eval(state))
+
+    def fold(self):
+        """ Fold an operation on a constant value. """
+        expr1 = self.expr1
+        if (self.oper is operator.not_ and isinstance(expr1, UnaryExpr) and
+                expr1.oper is operator.not_):
+            # "!!x" is just the truth of x
+            return UnaryExpr(self.template, self.line, operator.truth, expr1.expr1)
+
+        return self._fold_value(self.oper, expr1)
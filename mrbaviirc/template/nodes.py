@@ -16,6 +16,7 @@ from .errors import AbortError
 
 class Node:
     """ A node is a part of the expression that is rendered. """
+    __slots__ = ("_template", "line", "_env")
 
     def __init__(self, template, line):
         """ Initialize the node. """
@@ -63,12 +64,25 @@ class NodeList:
 
         return None
 
+    def get_render(self):
+        """ Return a callable to render the nodes.
+
+        For a list holding a single node this is the node's own render
+        method, avoiding the extra call through the list.  The abort check
+        for such a list is left to the enclosing node list.
+        """
+        if len(self.nodes) == 1:
+            return self.nodes[0].render
+
+        return self.render
+
     def __getitem__(self, index):
         return self.nodes[index]
 
 
 class TextNode(Node):
     """ A node that represents a raw block of text. """
+    __slots__ = ("text",)
 
     def __init__(self, template, line, text):
         """ Initialize a text node. """
@@ -82,6 +96,7 @@ class TextNode(Node):
 
 class EmitNode(Node):
     """ A node to output some value. """
+    __slots__ = ("expr",)
 
     def __init__(self, template, line, expr):
         """ Initialize the node. """
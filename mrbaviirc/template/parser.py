@@ -6,6 +6,7 @@ __license__ = "Apache License 2.0"
 
 
 import re
+import sys
 import operator
 
 from .errors import * # pylint: disable=wildcard-import
@@ -33,6 +34,8 @@ class TemplateParser:
         Token.TYPE_CLOSE_BRACKET
     ]
 
+    VAR_NAME_RE = re.compile("([lgpra]@)?([a-zA-Z_][a-zA-Z0-9_]*)")
+
     def __init__(self, template, text):
         """ Initialize the parser. """
 
@@ -49,14 +52,32 @@ class TemplateParser:
         self.autostrip = self.AUTOSTRIP_NONE
         self.autostrip_stack = []
 
+        # Literal values already seen, shared as one ValueExpr per template
+        self.values = {}
+
         # Handlers
         self.action_line = 0
-        self.action_handler_stack = [DefaultActionHandler(self, template)]
+        self.handlers = {}
+        self.action_handler_stack = [self.get_handler(DefaultActionHandler)]
+        self.action_handler_lines = [0]
+
+    def get_handler(self, handler_class):
+        """ Get the shared instance of a handler class for this parser.
+
+        Handlers do not keep any state of their own other than the parser and
+        template, so a single instance is used for each class.
+        """
+        handler = self.handlers.get(handler_class)
+        if handler is None:
+            handler = handler_class(self, self.template)
+            self.handlers[handler_class] = handler
+
+        return handler
 
     def push_handler(self, handler):
         """ Push a handler onto the handler stack. """
-        handler.line = self.action_line
         self.action_handler_stack.append(handler)
+        self.action_handler_lines.append(self.action_line)
 
 
     def pop_handler(self):
@@ -64,6 +85,7 @@ class TemplateParser:
 
         if len(self.action_handler_stack) > 1:
             self.action_handler_stack.pop()
+            self.action_handler_lines.pop()
         else:
             raise ParserError(
                 "Unexpected handler pop",
@@ -165,11 +187,12 @@ class TemplateParser:
         """ Parse a variable and return var """
 
         token = self.get_expected_token(pos, end, Token.TYPE_WORD, errmsg)
-        match = re.match("([lgpra]@)?([a-zA-Z_][a-zA-Z0-9_]*)", token.value)
+        match = self.VAR_NAME_RE.match(token.value)
 
         if match:
             var_type = match.group(1) # May be None if type not directly specified
-            var_name = match.group(2)
+            # Names stripped of a type prefix are new strings, intern them too
+            var_name = sys.intern(match.group(2))
 
             if allow_type:
                 if var_type == "l@":
@@ -398,7 +421,7 @@ class TemplateParser:
             raise ParserError(
                 "Unmatched action tag",
                 self.template.filename,
-                self.action_handler_stack[-1].line
+                self.action_handler_lines[-1]
             )
 
         return self.nodes
@@ -439,6 +462,10 @@ class TemplateParser:
         return (None, self.parse_expr(start, end))
 
     def parse_expr(self, start, end):
+        """ Parse the expression, folding constant parts. """
+        return self._parse_expr(start, end).fold()
+
+    def _parse_expr(self, start, end):
         # pylint: disable=too-many-locals
         """ Parse the expression. """
 
@@ -623,10 +650,11 @@ class TemplateParser:
         if nott is not None:
             token = self.tokens[nott]
             if nott == start:
-                return BooleanUnaryExpr(
+                # not_ always returns a bool, no need for BooleanUnaryExpr
+                return UnaryExpr(
                     self.template,
                     token.line,
-                    lambda a: not a,
+                    operator.not_,
                     self.parse_expr(nott + 1, end)
                 )
             raise ParserError(
@@ -645,7 +673,7 @@ class TemplateParser:
                 return UnaryExpr(
                     self.template,
                     token.line,
-                    lambda a: -a,
+                    operator.neg,
                     self.parse_expr(posneg + 1, end)
                 )
 
@@ -691,7 +719,11 @@ class TemplateParser:
             return expr
 
         if token.type in (Token.TYPE_STRING, Token.TYPE_INTEGER, Token.TYPE_FLOAT):
-            expr = ValueExpr(self.template, token.line, token.value)
+            # Keyed by type as well so 1 and 1.0 stay distinct
+            key = (token.type, token.value)
+            expr = self.values.get(key)
+            if expr is None:
+                expr = self.values[key] = ValueExpr(self.template, token.line, token.value)
 
             if start < end:
                 expr = self._parse_continuation(expr, start + 1, end)
@@ -714,7 +746,10 @@ class TemplateParser:
                 start += 1
                 if start <= end:
                     var = self.get_token_var(start, end)
-                    expr = LookupAttrExpr(self.template, token.line, expr, var)
+                    if isinstance(expr, LookupAttrExpr):
+                        expr = expr.extend(token.line, var)
+                    else:
+                        expr = LookupAttrExpr(self.template, token.line, expr, var)
                     start += 1
                     continue
 
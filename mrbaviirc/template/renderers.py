@@ -44,3 +44,7 @@ class StringRenderer(Renderer):
     def get(self):
         """ Get the buffer. """
         return "".join(self.buffer)
+
+    def clear(self):
+        """ Clear the buffer. """
+        self.buffer.clear()
@@ -52,6 +52,9 @@ class RenderState:
         self._vars = [{}, {}, {}, {}, {}, {}] # Indexed via the type of variable
         self._template_stack = []
         self._renderer_stack = []
+        self._renderer_pool = []
+        self._section_cache = {}
+        self._vars_pool = [] # Cleared private/internal dicts for reuse
 
     def set_var(self, name, value, where=LOCAL_VAR):
         """ Set a variable.
@@ -143,11 +146,13 @@ class RenderState:
             self._vars[self.RETURN_VAR]
         ))
 
+        pool = self._vars_pool
+
         self._vars[self.LOCAL_VAR] = self._vars[self.LOCAL_VAR].copy()
         # GLOBAL_VAR no change
-        self._vars[self.PRIVATE_VAR] = {}
-        self._vars[self.INTERNAL_VAR] = {}
-        self._vars[self.RETURN_VAR] = {}
+        self._vars[self.PRIVATE_VAR] = pool.pop() if pool else {}
+        self._vars[self.INTERNAL_VAR] = pool.pop() if pool else {}
+        self._vars[self.RETURN_VAR] = {} # Returned to the caller, not pooled
         # APP_VAR no change
 
         self.template = template
@@ -164,6 +169,12 @@ class RenderState:
 
         result = self._vars[self.RETURN_VAR]
 
+        # Private and internal variables never leave the state, reuse them
+        for where in (self.PRIVATE_VAR, self.INTERNAL_VAR):
+            values = self._vars[where]
+            values.clear()
+            self._vars_pool.append(values)
+
         (
             self.template,
             self._vars[self.LOCAL_VAR],
@@ -199,6 +210,27 @@ class RenderState:
         """ Restore the previous renderer. """
         self.renderer = self._renderer_stack.pop()
 
+    def _push_capture(self):
+        """ Internal use only.  Push an empty StringRenderer from a pool.
+
+        The renderer is reused once _pop_capture is called, so its contents
+        must be retrieved before that.
+
+        Returns
+        -------
+        mrbaviirc.template.renderers.StringRenderer
+            The new current renderer
+        """
+        pool = self._renderer_pool
+        return self.push_renderer(pool.pop() if pool else StringRenderer())
+
+    def _pop_capture(self):
+        """ Internal use only.  Restore the renderer from before _push_capture. """
+        renderer = self.renderer
+        self.pop_renderer()
+        renderer.clear()
+        self._renderer_pool.append(renderer)
+
     def append_section(self, name, contents):
         """ Append content to a section.
 
@@ -212,6 +244,7 @@ class RenderState:
         """
         section = self.sections.setdefault(name, [])
         section.append(contents)
+        self._section_cache.pop(name, None)
 
     def get_section(self, name):
         """ Get the contents of a section.
@@ -226,7 +259,13 @@ class RenderState:
         str
             The contents of the section
         """
-        return "".join(self.sections.get(name, []))
+        # Joined contents are cached until the section is appended to again
+        contents = self._section_cache.get(name)
+        if contents is None:
+            contents = "".join(self.sections.get(name, []))
+            self._section_cache[name] = contents
+
+        return contents
 
     def get_result(self):
         """ Get the render result. """
@@ -7,6 +7,8 @@ __license__ = "Apache License 2.0"
 
 __all__ = ["Token", "Tokenizer"]
 
+import sys
+
 from .errors import ParserError
 
 
@@ -503,7 +505,9 @@ class Tokenizer:
 
             break
 
-        token = Token(Token.TYPE_WORD, self.line, "".join(result))
+        # Words are action names and variable names, intern them so the
+        # dictionary lookups done on them can match by identity
+        token = Token(Token.TYPE_WORD, self.line, sys.intern("".join(result)))
         self.tokens.append(token)
 
         return pos
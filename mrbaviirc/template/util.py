@@ -8,6 +8,57 @@ __license__ = "Apache License 2.0"
 __all__ = ["DictToAttr"]
 
 
+import operator
+
+
+# Operators that are safe to call on constant values when parsing
+FOLD_OPERATORS = frozenset([
+    operator.add, operator.sub, operator.mul, operator.truediv,
+    operator.floordiv, operator.mod, operator.neg, operator.not_,
+    operator.eq, operator.ne, operator.gt, operator.ge, operator.lt,
+    operator.le
+])
+
+# Longest folded string.  The size is estimated before the operator is
+# called, so a constant such as "x" * 10000000 is never built when parsing.
+FOLD_MAX_STRING = 4096
+
+
+def fold_string_size(oper, values):
+    """ Estimate the length of a string result of folding an operator.
+
+    Parameters
+    ----------
+    oper : callable
+        The operator that would be called
+    values : tuple
+        The constant values that would be passed to the operator
+
+    Returns
+    -------
+    int
+        The length the result would have if it is a string, or 0 if the
+        result is not a string.  String formatting with % can not be
+        estimated, so it returns a length over the limit.
+    """
+    if oper is operator.add:
+        if all(isinstance(value, str) for value in values):
+            return sum(len(value) for value in values)
+
+    elif oper is operator.mul:
+        (left, right) = values
+        if isinstance(left, str) and isinstance(right, int):
+            return len(left) * right
+        if isinstance(right, str) and isinstance(left, int):
+            return len(right) * left
+
+    elif oper is operator.mod:
+        if isinstance(values[0], str):
+            return FOLD_MAX_STRING + 1
+
+    return 0
+
+
 class DictToAttr(dict):
     """ Make dictionary items accessible as attributes. """
 
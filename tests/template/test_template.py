@@ -13,7 +13,7 @@ import pytest
 
 from mrbaviirc.template import UnrestrictedLoader, Environment, StandardLib, StringRenderer
 from mrbaviirc.template import PrefixLoader, PrefixPathLoader, SearchPathLoader
-from mrbaviirc.template import AbortError
+from mrbaviirc.template import AbortError, UnknownVariableError
 
 def hook1a(state, params):
     state.renderer.render("Hook1 A: {0}\n".format(state.line))
@@ -209,3 +209,114 @@ def test_load_text():
 
     assert contents == target_contents
 
+
+
+def test_load_file_cache():
+    """ Test the environment template cache. """
+    loader = SearchPathLoader(DATADIR)
+    env = Environment(loader=loader)
+
+    tmpl = env.load_file("include_1.tmpl")
+    assert env.load_file("include_1.tmpl") is tmpl
+
+    inc = env.load_file("include_1.inc", tmpl)
+    assert env.load_file("include_1.inc", tmpl) is inc
+
+    env.clear_cache()
+    tmpl2 = env.load_file("include_1.tmpl")
+    assert tmpl2 is not tmpl
+
+    loader.clear_cache()
+    assert env.load_file("include_1.tmpl") is not tmpl2
+
+
+def test_attr_chain_error():
+    """ Test the failing attribute of a chain is reported. """
+    env = Environment(loader=UnrestrictedLoader())
+    tmpl = env.load_text("{{ lib.stringlib.missing.value }}", "chain.tmpl")
+
+    with pytest.raises(UnknownVariableError) as info:
+        tmpl.render(StringRenderer(), {"lib": StandardLib()})
+
+    assert str(info.value) == "missing on: chain.tmpl:1"
+
+    class Counter(object):
+        """ Count reads of an attribute. """
+        count = 0
+
+        @property
+        def value(self):
+            Counter.count += 1
+            return self
+
+    tmpl = env.load_text("{{ obj.value\n.value.missing }}", "chain.tmpl")
+
+    with pytest.raises(UnknownVariableError) as info:
+        tmpl.render(StringRenderer(), {"obj": Counter()})
+
+    assert str(info.value) == "missing on: chain.tmpl:2"
+    assert Counter.count == 2
+
+
+def test_switch_case_error():
+    """ Test an error in a matched switch case is not retried. """
+    env = Environment(loader=UnrestrictedLoader())
+    tmpl = env.load_text(
+        "{% switch x %}{% eq 1 %}one {{ lib.len(5) }}{% endswitch %}",
+        "switch.tmpl"
+    )
+    rndr = StringRenderer()
+
+    with pytest.raises(TypeError):
+        tmpl.render(rndr, {"x": 1, "lib": StandardLib()})
+
+    assert rndr.get() == "one "
+
+
+def test_section_cache():
+    """ Test appending to a section replaces its cached contents. """
+    seen = []
+
+    def hook(state, params):
+        seen.append(state.get_section("list"))
+        state.append_section("list", "x,")
+        seen.append(state.get_section("list"))
+
+    env = Environment(loader=UnrestrictedLoader())
+    env.register_hook("check", hook)
+
+    tmpl = env.load_text(
+        "{% section \"list\" %}1,{% endsection %}{% hook \"check\" %}"
+        "{% section \"list\" %}2,{% endsection %}{% use \"list\" %}",
+        "section.tmpl"
+    )
+    rndr = StringRenderer()
+    result = tmpl.render(rndr)
+
+    assert seen == ["1,", "1,x,"]
+    assert rndr.get() == "1,x,2,"
+    assert result.sections["list"] == "1,x,2,"
+
+
+def test_push_renderer():
+    """ Test a pushed renderer keeps its contents after being popped. """
+    captured = []
+
+    def hook(state, params):
+        renderer = state.push_renderer()
+        state.renderer.render("inner")
+        state.pop_renderer()
+        captured.append(renderer)
+
+    env = Environment(loader=UnrestrictedLoader())
+    env.register_hook("capture", hook)
+
+    tmpl = env.load_text(
+        "{% hook \"capture\" %}{% var x %}text {{ 1 + y }}{% endvar %}{{ x }}",
+        "push.tmpl"
+    )
+    rndr = StringRenderer()
+    tmpl.render(rndr, {"y": 1})
+
+    assert captured[0].get() == "inner"
+    assert rndr.get() == "text 2"